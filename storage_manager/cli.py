@@ -1,20 +1,59 @@
 """Main CLI entry point for the storage manager."""
 
+import importlib
+
 import click
 
-from storage_manager.commands.node_modules import clean_node_modules
-from storage_manager.commands.screenshots import clean_screenshots
-from storage_manager.commands.large_files import find_large
+class LazyGroup(click.Group):
+    """Click group that only imports a subcommand's module when it is invoked."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name to ("module.attribute", short help)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
 
-@click.group()
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            import_path, _ = self.lazy_subcommands[cmd_name]
+            module_name, attr_name = import_path.rsplit('.', 1)
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        # Use the registered help so --help doesn't import every command
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+            elif not self.commands[name].hidden:
+                rows.append((name, self.commands[name].get_short_help_str()))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        'clean-node-modules': (
+            'storage_manager.commands.node_modules.clean_node_modules',
+            'Find and optionally delete node_modules directories.',
+        ),
+        'clean-screenshots': (
+            'storage_manager.commands.screenshots.clean_screenshots',
+            'Find and optionally delete screenshots older than specified days.',
+        ),
+        'find-large': (
+            'storage_manager.commands.large_files.find_large',
+            'Find files larger than specified size (in MB) in the given directory.',
+        ),
+    },
+)
 def cli():
     """Storage Manager CLI - Helps you manage your storage space efficiently."""
     pass
 
-# Register commands
-cli.add_command(clean_node_modules)
-cli.add_command(clean_screenshots)
-cli.add_command(find_large)
-
 if __name__ == '__main__':
     cli()
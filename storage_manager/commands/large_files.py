@@ -1,8 +1,14 @@
 """Command for finding and managing large files."""
 
 import os
+import re
+import time
+import heapq
 import mimetypes
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
 import click
 from rich.console import Console
@@ -14,12 +20,32 @@ from rich.align import Align
 from tqdm import tqdm
 
 from storage_manager.utils.size_utils import format_size
+from storage_manager.utils.visualization import size_bar
+from storage_manager.utils.walk_utils import scan_files
 
 console = Console()
 
-def get_file_type(filepath):
-    """Get the file type category based on mime type."""
-    mime_type, _ = mimetypes.guess_type(filepath)
+# Maximum number of files listed in the results table
+MAX_RESULTS = 1000
+
+# File type categories for common extensions, checked before falling back to mimetypes.
+# Some entries intentionally differ from what mimetypes gives, e.g. Office files
+# (reported as xml, so previously Code) are Documents and source files are Code.
+_EXT_TO_CATEGORY = {
+    **dict.fromkeys(['.mp4', '.m4v', '.mov', '.avi', '.mkv', '.webm', '.wmv', '.flv', '.mpg', '.mpeg', '.3gp'], "Video"),
+    **dict.fromkeys(['.mp3', '.m4a', '.aac', '.wav', '.flac', '.ogg', '.opus', '.aif', '.aiff', '.wma'], "Audio"),
+    **dict.fromkeys(['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tif', '.tiff', '.webp', '.heic', '.svg', '.ico', '.psd'], "Image"),
+    **dict.fromkeys(['.txt', '.md', '.csv', '.tsv', '.log', '.html', '.htm', '.css'], "Text"),
+    **dict.fromkeys(['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.odt', '.ods', '.odp', '.epub'], "Document"),
+    **dict.fromkeys(['.zip', '.tar', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar'], "Archive"),
+    **dict.fromkeys(['.py', '.js', '.ts', '.jsx', '.tsx', '.json', '.xml', '.yaml', '.yml', '.sh',
+                     '.c', '.h', '.cpp', '.java', '.go', '.rs', '.rb', '.php', '.swift'], "Code"),
+}
+
+@lru_cache(maxsize=None)
+def _get_mime_file_type(ext):
+    """Get the file type category for an extension based on mime type."""
+    mime_type, _ = mimetypes.guess_type('file' + ext)
     if mime_type is None:
         return "Unknown"
     
@@ -35,18 +61,26 @@ def get_file_type(filepath):
             return "Code"
     return "Other"
 
-def create_type_chart(type_sizes):
+def get_file_type(filepath):
+    """Get the file type category based on the file extension."""
+    ext = os.path.splitext(filepath)[1].lower()
+    category = _EXT_TO_CATEGORY.get(ext)
+    if category is None:
+        return _get_mime_file_type(ext)
+    return category
+
+def create_type_chart(type_sizes, max_label_length=None):
     """Create a bar chart visualization of file types and their sizes."""
     if not type_sizes:
         return Panel(Align.center("[yellow]Processing...[/yellow]"))
     
     max_size = max(type_sizes.values()) if type_sizes else 1
-    max_label_length = max(len(type_name) for type_name in type_sizes.keys()) if type_sizes else 0
+    if max_label_length is None:
+        max_label_length = max(len(type_name) for type_name in type_sizes.keys())
     
     chart = ""
-    for file_type, size in sorted(type_sizes.items(), key=lambda x: x[1], reverse=True):
-        bar_width = int((size / max_size) * 40)  # 40 chars max width
-        bar = "█" * bar_width + "░" * (40 - bar_width)
+    for file_type, size in sorted(type_sizes.items(), key=itemgetter(1), reverse=True):
+        bar = size_bar(size, max_size)
         chart += f"{file_type:<{max_label_length}} │ [green]{bar}[/green] {format_size(size)}\n"
     
     return Panel(
@@ -55,11 +89,13 @@ def create_type_chart(type_sizes):
         border_style="blue"
     )
 
-def find_large_files(directory, min_size_mb, ignore_patterns=None):
-    """Find files larger than the specified size."""
+def find_large_files(directory, min_size_mb, type_sizes, ignore_patterns=None, optimize_hdd=False):
+    """Find files larger than the specified size.
+
+    Yields (filepath, size, file_type, mtime) tuples as they are found and adds
+    each file's size to type_sizes under its file type.
+    """
     min_size = min_size_mb * 1024 * 1024  # Convert MB to bytes
-    large_files = []
-    type_sizes = defaultdict(int)
     
     ignore_patterns = ignore_patterns or [
         'node_modules',
@@ -70,60 +106,67 @@ def find_large_files(directory, min_size_mb, ignore_patterns=None):
         '__pycache__'
     ]
     
-    def should_ignore(path):
-        return any(pattern in path for pattern in ignore_patterns)
+    # Match all patterns in one pass against each directory's own name
+    ignore_re = re.compile('|'.join(re.escape(pattern) for pattern in ignore_patterns))
+    
+    def should_ignore(name):
+        return ignore_re.search(name) is not None
     
-    # First, count total files for progress bar
-    total_files = sum(len(files) for _, _, files in os.walk(directory) if not should_ignore(_))
+    # Only rebuild the chart at the Live refresh rate, not on every match
+    refresh_interval = 0.25
+    last_update = time.monotonic()
+    max_label_length = 0
     
     with Live(create_type_chart(type_sizes), refresh_per_second=4) as live:
-        with tqdm(total=total_files, desc="Scanning files", unit="files") as pbar:
-            for root, _, files in os.walk(directory):
-                if should_ignore(root):
-                    continue
-                    
-                for filename in files:
-                    pbar.update(1)
-                    filepath = os.path.join(root, filename)
-                    
-                    try:
-                        size = os.path.getsize(filepath)
-                        if size >= min_size:
-                            file_type = get_file_type(filepath)
-                            type_sizes[file_type] += size
-                            large_files.append((
-                                filepath,
-                                size,
-                                file_type,
-                                datetime.fromtimestamp(os.path.getmtime(filepath))
-                            ))
-                            live.update(create_type_chart(type_sizes))
-                    except (OSError, FileNotFoundError):
-                        continue
-    
-    return large_files, type_sizes
+        with tqdm(desc="Scanning files", unit="files") as pbar:
+            for files in scan_files(directory, skip_dir=should_ignore, sort_by_inode=optimize_hdd):
+                pbar.update(len(files))
+                for filepath, st in files:
+                    size = st.st_size
+                    if size >= min_size:
+                        file_type = get_file_type(filepath)
+                        if file_type not in type_sizes:
+                            max_label_length = max(max_label_length, len(file_type))
+                        type_sizes[file_type] += size
+                        yield filepath, size, file_type, st.st_mtime
+                        
+                        now = time.monotonic()
+                        if now - last_update >= refresh_interval:
+                            live.update(create_type_chart(type_sizes, max_label_length))
+                            last_update = now
+            
+            live.update(create_type_chart(type_sizes, max_label_length))
 
 @click.command()
 @click.argument('directory', type=click.Path(exists=True), default=os.path.expanduser('~'))
 @click.option('--min-size', '-s', type=int, default=100, help='Minimum file size in MB (default: 100)')
 @click.option('--delete', is_flag=True, help='Enable deletion of selected files')
 @click.option('--type', '-t', help='Filter by file type (e.g., Video, Image, Document)')
-def find_large(directory, min_size, delete, type):
+@click.option('--optimize-hdd', is_flag=True, help='Scan serially in inode order to reduce seeks on spinning disks')
+def find_large(directory, min_size, delete, type, optimize_hdd):
     """Find files larger than specified size (in MB) in the given directory."""
     console.print(f"\n[bold blue]Scanning for files larger than {min_size}MB in: {directory}[/bold blue]\n")
     
-    large_files, type_sizes = find_large_files(directory, min_size)
+    type_sizes = defaultdict(int)
+    large_files = find_large_files(directory, min_size, type_sizes, optimize_hdd=optimize_hdd)
     
-    if not large_files:
+    # Filter by type if specified
+    if type:
+        large_files = (f for f in large_files if f[2].lower() == type.lower())
+    
+    # Only keep the largest files for display, sorted by size. One extra is kept
+    # to tell whether any were left out.
+    large_files = heapq.nlargest(MAX_RESULTS + 1, large_files, key=itemgetter(1))
+    truncated = len(large_files) > MAX_RESULTS
+    del large_files[MAX_RESULTS:]
+    
+    if not type_sizes:
         console.print("[yellow]No large files found.[/yellow]")
         return
     
-    # Filter by type if specified
-    if type:
-        large_files = [f for f in large_files if f[2].lower() == type.lower()]
-        if not large_files:
-            console.print(f"[yellow]No {type} files found.[/yellow]")
-            return
+    if not large_files:
+        console.print(f"[yellow]No {type} files found.[/yellow]")
+        return
     
     # Create a table to display results
     table = Table(show_header=True, header_style="bold magenta")
@@ -132,17 +175,23 @@ def find_large(directory, min_size, delete, type):
     table.add_column("Type", justify="center")
     table.add_column("Modified Date", justify="right")
     
-    total_size = 0
-    for filepath, size, file_type, modified_time in sorted(large_files, key=lambda x: x[1], reverse=True):
-        total_size += size
+    for filepath, size, file_type, mtime in large_files:
         table.add_row(
             os.path.relpath(filepath, directory),
             format_size(size),
             file_type,
-            modified_time.strftime("%Y-%m-%d %H:%M")
+            datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
         )
     
+    # Totals come from type_sizes so they include files beyond the displayed ones
+    if type:
+        total_size = sum(size for file_type, size in type_sizes.items() if file_type.lower() == type.lower())
+    else:
+        total_size = sum(type_sizes.values())
+    
     console.print(table)
+    if truncated:
+        console.print(f"[dim]Showing the {MAX_RESULTS} largest files.[/dim]")
     console.print(f"\n[bold green]Total space used by large files: {format_size(total_size)}[/bold green]")
     
     if delete:
@@ -153,11 +202,13 @@ def find_large(directory, min_size, delete, type):
         
         if files_to_delete:
             with tqdm(total=len(files_to_delete), desc="Deleting files", unit="files") as pbar:
-                for filepath in files_to_delete:
-                    try:
-                        os.remove(filepath)
-                        pbar.update(1)
-                    except Exception as e:
-                        console.print(f"[red]✗[/red] Failed to delete {filepath}: {str(e)}")
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    futures = {executor.submit(os.remove, filepath): filepath for filepath in files_to_delete}
+                    for future in as_completed(futures):
+                        e = future.exception()
+                        if e is None:
+                            pbar.update(1)
+                        else:
+                            console.print(f"[red]✗[/red] Failed to delete {futures[future]}: {str(e)}")
             
             console.print("\n[bold green]Cleanup completed![/bold green]")
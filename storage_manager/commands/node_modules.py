@@ -17,10 +17,7 @@ console = Console()
 def find_node_modules(search_path, spec):
     """Find node_modules directories in the given path."""
     dirs_to_scan = []
-    # First count total directories for the progress bar
-    total_dirs = sum(len(dirs) for _, dirs, _ in os.walk(search_path))
-    
-    with tqdm(total=total_dirs, desc="Scanning directories", unit="dirs") as pbar:
+    with tqdm(desc="Scanning directories", unit="dirs") as pbar:
         for root, dirs, _ in os.walk(search_path):
             pbar.update(len(dirs))
             if spec.match_file(root):
@@ -57,11 +54,13 @@ def clean_node_modules(search_path, delete):
 
     # Calculate sizes with live updating bar chart
     sizes_dict = {}
+    max_label_length = 0
     with Live(create_size_chart(sizes_dict), refresh_per_second=4) as live:
         for path in node_modules_dirs:
             size = get_directory_size(path)
             sizes_dict[path] = size
-            live.update(create_size_chart(sizes_dict))
+            max_label_length = max(max_label_length, len(os.path.dirname(path)))
+            live.update(create_size_chart(sizes_dict, max_label_length))
 
     total_size = sum(sizes_dict.values())
     console.print(f"\n[bold green]Total space used by node_modules: {format_size(total_size)}[/bold green]")
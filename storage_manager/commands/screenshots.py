@@ -2,6 +2,7 @@
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import click
 from rich.console import Console
@@ -12,15 +13,22 @@ from storage_manager.utils.size_utils import format_size
 
 console = Console()
 
+# Common screenshot naming patterns, combined into a single alternation. The
+# patterns are ASCII, so they match raw filename bytes without decoding them.
+_SCREENSHOT_RE = re.compile(
+    rb"Screenshot.*\.png"                       # macOS Ventura and generic pattern
+    rb"|Screen Shot \d{4}-\d{2}-\d{2}.*\.png"   # older macOS pattern
+    rb"|Screen Recording.*\.mov"                # screen recordings
+)
+
 def is_screenshot(filename):
     """Check if a file is a screenshot based on common screenshot naming patterns."""
-    patterns = [
-        r"Screenshot \d{4}-\d{2}-\d{2}.*\.png",  # macOS Ventura pattern
-        r"Screen Shot \d{4}-\d{2}-\d{2}.*\.png",  # older macOS pattern
-        r"Screenshot.*\.png",                      # generic screenshot pattern
-        r"Screen Recording.*\.mov"                 # screen recordings
-    ]
-    return any(re.match(pattern, filename) for pattern in patterns)
+    if isinstance(filename, str):
+        filename = os.fsencode(filename)
+    # Every pattern starts with "Screen", so skip the regex for everything else
+    if not filename.startswith(b"Screen"):
+        return False
+    return _SCREENSHOT_RE.match(filename) is not None
 
 def find_old_screenshots(directory, days_old):
     """Find screenshots older than specified days."""
@@ -28,22 +36,24 @@ def find_old_screenshots(directory, days_old):
     old_files = []
     total_size = 0
     
-    with tqdm(total=len(os.listdir(directory)), desc="Scanning files", unit="files") as pbar:
-        for filename in os.listdir(directory):
-            pbar.update(1)
-            filepath = os.path.join(directory, filename)
-            
-            if not os.path.isfile(filepath):
-                continue
-                
-            if is_screenshot(filename):
-                modified_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-                age = now - modified_time
+    with tqdm(desc="Scanning files", unit="files") as pbar:
+        # Scan with a bytes path so entry names are only decoded for matches
+        with os.scandir(os.fsencode(directory)) as it:
+            for entry in it:
+                pbar.update(1)
                 
-                if age.days > days_old:
-                    size = os.path.getsize(filepath)
-                    old_files.append((filepath, size, modified_time))
-                    total_size += size
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                    
+                if is_screenshot(entry.name):
+                    st = entry.stat(follow_symlinks=False)
+                    modified_time = datetime.fromtimestamp(st.st_mtime)
+                    age = now - modified_time
+                    
+                    if age.days > days_old:
+                        size = st.st_size
+                        old_files.append((os.fsdecode(entry.path), size, modified_time))
+                        total_size += size
     
     return old_files, total_size
 
@@ -84,11 +94,13 @@ def clean_screenshots(days, delete):
     if delete and old_files:
         if click.confirm('\nDo you want to delete these screenshots?'):
             with tqdm(total=len(old_files), desc="Deleting screenshots", unit="files") as pbar:
-                for filepath, _, _ in old_files:
-                    try:
-                        os.remove(filepath)
-                        pbar.update(1)
-                    except Exception as e:
-                        console.print(f"[red]✗[/red] Failed to delete {filepath}: {str(e)}")
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    futures = {executor.submit(os.remove, filepath): filepath for filepath, _, _ in old_files}
+                    for future in as_completed(futures):
+                        e = future.exception()
+                        if e is None:
+                            pbar.update(1)
+                        else:
+                            console.print(f"[red]✗[/red] Failed to delete {futures[future]}: {str(e)}")
             
             console.print("\n[bold green]Cleanup completed![/bold green]")
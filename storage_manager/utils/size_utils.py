@@ -3,28 +3,21 @@
 import os
 from tqdm import tqdm
 
+from storage_manager.utils.walk_utils import scan_files
+
 def get_directory_size(path):
     """Calculate the total size of a directory."""
     total_size = 0
-    files = []
-    for dirpath, _, filenames in os.walk(path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            files.append(fp)
-    
-    with tqdm(total=len(files), desc=f"Calculating size of {os.path.basename(path)}", unit="files") as pbar:
-        for fp in files:
-            try:
-                total_size += os.path.getsize(fp)
-                pbar.update(1)
-            except (OSError, FileNotFoundError):
-                continue
+    with tqdm(desc=f"Calculating size of {os.path.basename(path)}", unit="files") as pbar:
+        for files in scan_files(path):
+            total_size += sum(st.st_size for _, st in files)
+            pbar.update(len(files))
     return total_size
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 def format_size(size):
     """Format size in bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024.0:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
-    return f"{size:.2f} TB"
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit
+    k = min(max((int(size).bit_length() - 1) // 10, 0), len(_UNITS) - 1)
+    return f"{size / (1 << (k * 10)):.2f} {_UNITS[k]}"
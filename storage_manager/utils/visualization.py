@@ -1,23 +1,35 @@
 """Utilities for visualizing data in the terminal."""
 
 import os
+from operator import itemgetter
 from rich.panel import Panel
 from rich.align import Align
 
-def create_size_chart(sizes_dict):
+from storage_manager.utils.size_utils import format_size
+
+BAR_WIDTH = 40
+
+# Every possible bar, indexed by the number of filled cells
+_BARS = ["█" * filled + "░" * (BAR_WIDTH - filled) for filled in range(BAR_WIDTH + 1)]
+
+def size_bar(size, max_size):
+    """Get a fixed-width bar showing size relative to max_size."""
+    return _BARS[int((size / max_size) * BAR_WIDTH)]
+
+def create_size_chart(sizes_dict, max_label_length=None):
     """Create a bar chart visualization of directory sizes."""
     if not sizes_dict:
         return Panel(Align.center("[yellow]Processing...[/yellow]"))
     
     max_size = max(sizes_dict.values()) if sizes_dict else 1
-    max_label_length = max(len(os.path.dirname(path)) for path in sizes_dict.keys()) if sizes_dict else 0
+    if max_label_length is None:
+        max_label_length = max(len(os.path.dirname(path)) for path in sizes_dict.keys())
     
     chart = ""
-    for path, size in sorted(sizes_dict.items(), key=lambda x: x[1], reverse=True):
+    for path, size in sorted(sizes_dict.items(), key=itemgetter(1), reverse=True):
         label = os.path.dirname(path)
         size_formatted = format_size(size)
-        bar_width = int((size / max_size) * 40)  # 40 chars max width
-        bar = "█" * bar_width + "░" * (40 - bar_width)
+        bar = size_bar(size, max_size)
         chart += f"{label:<{max_label_length}} │ [green]{bar}[/green] {size_formatted}\n"
     
     return Panel(